@@ -1,25 +1,28 @@
-import pandas as pd
-import gspread
-from oauth2client.service_account import ServiceAccountCredentials
 import os
 import logging
-from typing import Optional
-from extract import load_config, check_required_directories
+from typing import Optional, TYPE_CHECKING
+from context import RuntimeContext
+
+if TYPE_CHECKING:
+    import gspread
 
 logger = logging.getLogger('ETL-Process.Load')
 
-def get_google_client() -> gspread.Client:
+def get_google_client(context: RuntimeContext) -> 'gspread.Client':
     """
     Configura y retorna el cliente de Google Sheets
     """
+    # gspread y oauth2client solo se necesitan en la etapa de carga
+    import gspread
+    from oauth2client.service_account import ServiceAccountCredentials
+
     try:
         logger.info("Configurando cliente de Google Sheets")
-        config = load_config()
         
         scope = ["https://spreadsheets.google.com/feeds", "https://www.googleapis.com/auth/drive"]
         logger.debug("Configurando credenciales con scope de Google Sheets y Drive")
         
-        credentials_dict = config['google_services']['client_id']
+        credentials_dict = context.google_credentials
         creds = ServiceAccountCredentials.from_json_keyfile_dict(credentials_dict, scope)
         client = gspread.authorize(creds)
         logger.info("Cliente de Google Sheets configurado exitosamente")
@@ -29,10 +32,12 @@ def get_google_client() -> gspread.Client:
         logger.error("Error configurando cliente de Google Sheets", exc_info=True)
         raise
 
-def load_to_sheets(archivo_entrada: str, spreadsheet_id: str = "1KyRGrnkql19dQYnnPxmecLd3hQ7Cn2fLJ8BOBLHKtMA") -> bool:
+def load_to_sheets(archivo_entrada: str, context: RuntimeContext, spreadsheet_id: str = "1KyRGrnkql19dQYnnPxmecLd3hQ7Cn2fLJ8BOBLHKtMA") -> bool:
     """
     Carga los datos del archivo Excel procesado a Google Sheets
     """
+    import pandas as pd
+
     try:
         logger.info(f"Iniciando carga de datos desde: {os.path.basename(archivo_entrada)}")
         
@@ -42,7 +47,7 @@ def load_to_sheets(archivo_entrada: str, spreadsheet_id: str = "1KyRGrnkql19dQYn
         logger.info(f"Datos leídos del Excel, shape: {df.shape}")
 
         # Obtener cliente de Google Sheets
-        client = get_google_client()
+        client = get_google_client(context)
 
         # Abrir la hoja de Google Sheets usando el ID
         logger.info(f"Conectando con Google Sheet ID: {spreadsheet_id}")
@@ -79,7 +84,7 @@ def load_to_sheets(archivo_entrada: str, spreadsheet_id: str = "1KyRGrnkql19dQYn
         logger.error(f"Error cargando datos a Google Sheets: {str(e)}", exc_info=True)
         return False
 
-def load_data(archivo_procesado: str) -> bool:
+def load_data(archivo_procesado: str, context: RuntimeContext) -> bool:
     """
     Función principal para cargar los datos
     """
@@ -93,7 +98,7 @@ def load_data(archivo_procesado: str) -> bool:
             raise ValueError(msg)
 
         # Cargar los datos a Google Sheets
-        result = load_to_sheets(archivo_procesado)
+        result = load_to_sheets(archivo_procesado, context)
         
         if result:
             logger.info("=== PROCESO DE CARGA COMPLETADO EXITOSAMENTE ===")
@@ -1,17 +1,21 @@
 import os
-import pandas as pd
 from datetime import datetime
-import json
 import logging
-from typing import List, Dict
-from extract import load_config, check_required_directories
+from typing import List, Dict, TYPE_CHECKING
+from context import RuntimeContext
+from extract import check_required_directories
+
+if TYPE_CHECKING:
+    import pandas as pd
 
 logger = logging.getLogger('ETL-Process.Transform')
 
-def procesar_excel(archivo_excel: str, nombre_sheet: str) -> pd.DataFrame:
+def procesar_excel(archivo_excel: str, nombre_sheet: str) -> 'pd.DataFrame':
     """
     Procesa un archivo Excel y retorna un DataFrame con los datos transformados
     """
+    import pandas as pd
+
     try:
         logger.info(f"Procesando archivo: {os.path.basename(archivo_excel)}, hoja: {nombre_sheet}")
         
@@ -62,17 +66,19 @@ def procesar_excel(archivo_excel: str, nombre_sheet: str) -> pd.DataFrame:
         logger.error(f"Error procesando Excel {archivo_excel}: {str(e)}", exc_info=True)
         raise
 
-def contar_presente(df: pd.DataFrame) -> pd.Series:
+def contar_presente(df: 'pd.DataFrame') -> 'pd.Series':
     """
     Cuenta los presentes de la C01 a la C12
     """
     columnas_clases = [f'C{i:02d}' for i in range(1, 13)]
     return df[columnas_clases].apply(lambda x: (x == 'P').sum())
 
-def procesar_archivos(archivos: List[str], hoja_excel: str = "Probacionistas") -> pd.DataFrame:
+def procesar_archivos(archivos: List[str], hoja_excel: str = "Probacionistas") -> 'pd.DataFrame':
     """
     Procesa una lista de archivos Excel y retorna un DataFrame consolidado
     """
+    import pandas as pd
+
     logger.info(f"Iniciando procesamiento de {len(archivos)} archivos")
     dataframes = []
 
@@ -120,7 +126,7 @@ def procesar_archivos(archivos: List[str], hoja_excel: str = "Probacionistas") -
     
     return resultado_final
 
-def transform_data(input_data: Dict[str, any]) -> str:
+def transform_data(input_data: Dict[str, any], context: RuntimeContext) -> str:
     """
     Función principal que transforma los datos
     """
@@ -134,9 +140,8 @@ def transform_data(input_data: Dict[str, any]) -> str:
 
         logger.info(f"Procesando {len(input_data['files'])} archivos de {input_data['download_folder']}")
         
-        # Cargar configuración y verificar directorios
-        config = load_config()
-        dirs = check_required_directories()
+        # Verificar directorios
+        dirs = check_required_directories(context)
 
         # Procesar los archivos
         df_final = procesar_archivos(input_data['files'])
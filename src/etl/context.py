@@ -0,0 +1,83 @@
+import os
+import json
+import time
+from typing import Dict, Any, Optional
+
+# Rutas obligatorias dentro de la sección "paths" del config.json
+REQUIRED_PATHS = ('downloads_dir', 'processed_dir', 'logs_dir')
+
+def get_project_root() -> str:
+    """
+    Retorna la ruta absoluta a la raíz del proyecto (2 niveles arriba de este script)
+    """
+    script_dir = os.path.dirname(os.path.abspath(__file__))
+    return os.path.dirname(os.path.dirname(script_dir))
+
+def load_config(config_path: Optional[str] = None) -> Dict[str, Any]:
+    """
+    Carga el archivo de configuración desde la raíz del proyecto
+    """
+    if config_path is None:
+        config_path = os.path.join(get_project_root(), 'config.json')
+
+    with open(config_path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+def validate_config(config: Dict[str, Any]) -> None:
+    """
+    Valida la estructura del config.json, lanza ValueError describiendo el primer problema encontrado.
+    Las credenciales de Google se validan al usarse, solo la etapa de carga las necesita
+    """
+    if not isinstance(config, dict):
+        raise ValueError("La configuración debe ser un objeto JSON")
+
+    paths = config.get('paths')
+    if not isinstance(paths, dict):
+        raise ValueError("Falta la sección 'paths' en la configuración")
+    for key in REQUIRED_PATHS:
+        if not isinstance(paths.get(key), str) or not paths[key]:
+            raise ValueError(f"Falta la ruta 'paths.{key}' en la configuración")
+
+    excel_urls = config.get('excel_urls')
+    if not isinstance(excel_urls, dict) or not excel_urls:
+        raise ValueError("La sección 'excel_urls' debe contener al menos una sede")
+    for sede, info in excel_urls.items():
+        if not isinstance(info, dict):
+            raise ValueError(f"La sede '{sede}' debe ser un objeto con 'nivel' y 'url'")
+        for key in ('nivel', 'url'):
+            if not isinstance(info.get(key), str) or not info[key]:
+                raise ValueError(f"Falta '{key}' para la sede '{sede}' en 'excel_urls'")
+
+class RuntimeContext:
+    """
+    Configuración validada y rutas absolutas compartidas por todas las etapas del ETL
+    """
+
+    def __init__(self, config: Dict[str, Any], project_root: str, load_seconds: float = 0.0):
+        self.config = config
+        self.project_root = project_root
+        self.load_seconds = load_seconds
+        self.dirs = {
+            key: os.path.join(project_root, config['paths'][key])
+            for key in REQUIRED_PATHS
+        }
+
+    @property
+    def excel_urls(self) -> Dict[str, Dict[str, str]]:
+        return self.config['excel_urls']
+
+    @property
+    def google_credentials(self) -> Dict[str, Any]:
+        google_services = self.config.get('google_services')
+        if not isinstance(google_services, dict) or not isinstance(google_services.get('client_id'), dict):
+            raise ValueError("Falta la sección 'google_services.client_id' en la configuración")
+        return google_services['client_id']
+
+def load_runtime_context(config_path: Optional[str] = None) -> RuntimeContext:
+    """
+    Carga y valida la configuración una sola vez, retorna el contexto para las etapas del ETL
+    """
+    start = time.perf_counter()
+    config = load_config(config_path)
+    validate_config(config)
+    return RuntimeContext(config, get_project_root(), time.perf_counter() - start)
@@ -1,4 +1,8 @@
-from extract import main as extract_main, load_config, check_required_directories
+import time
+_IMPORT_START = time.perf_counter()
+
+from context import RuntimeContext, load_runtime_context
+from extract import main as extract_main
 from Transform import transform_data
 from Load import load_data
 import logging
@@ -6,15 +10,12 @@ import os
 from datetime import datetime
 import traceback
 
-def setup_logging():
+def setup_logging(context: RuntimeContext):
     """
     Configura el logging para el proceso ETL con formato detallado
     """
-    # Obtener la ruta de logs del config
-    config = load_config()
-    script_dir = os.path.dirname(os.path.abspath(__file__))
-    project_root = os.path.dirname(os.path.dirname(script_dir))
-    logs_dir = os.path.join(project_root, config['paths']['logs_dir'])
+    # Obtener la ruta de logs del contexto
+    logs_dir = context.dirs['logs_dir']
     
     # Asegurar que el directorio de logs existe
     if not os.path.exists(logs_dir):
@@ -59,17 +60,26 @@ def run_etl():
     """
     Ejecuta el proceso ETL completo con logging detallado
     """
-    logger = setup_logging()
+    # Cargar y validar la configuración una sola vez para todas las etapas
+    try:
+        context = load_runtime_context()
+    except (OSError, ValueError) as e:
+        print(f"Error cargando la configuración: {str(e)}")
+        return False
+    
+    logger = setup_logging(context)
     start_time = datetime.now()
     
     try:
         logger.info("=== INICIANDO PROCESO ETL ===")
         logger.info(f"Hora de inicio: {start_time.strftime('%Y-%m-%d %H:%M:%S.%f')}")
+        logger.info(f"Configuración cargada y validada en {context.load_seconds:.3f} segundos")
+        logger.info(f"Tiempo de arranque: {time.perf_counter() - _IMPORT_START:.3f} segundos")
         
         # 1. Extraer datos
         logger.info("Iniciando proceso de extracción...")
         extract_start = datetime.now()
-        extract_result = extract_main()
+        extract_result = extract_main(context)
         
         if not extract_result:
             raise Exception("Falló el proceso de extracción")
@@ -81,7 +91,7 @@ def run_etl():
         # 2. Transformar datos
         logger.info("Iniciando proceso de transformación...")
         transform_start = datetime.now()
-        transform_result = transform_data(extract_result)
+        transform_result = transform_data(extract_result, context)
         
         if not transform_result:
             raise Exception("Falló el proceso de transformación")
@@ -92,7 +102,7 @@ def run_etl():
         # 3. Cargar datos
         logger.info("Iniciando proceso de carga...")
         load_start = datetime.now()
-        load_result = load_data(transform_result)
+        load_result = load_data(transform_result, context)
         
         if not load_result:
             raise Exception("Falló el proceso de carga")
@@ -1,67 +1,33 @@
+import time
+_IMPORT_START = time.perf_counter()
+
 import os
 import datetime
-import requests
-import pandas as pd
-import openpyxl
-import json
 import logging
+from typing import Optional
 from urllib.parse import urlparse, parse_qs
-from io import BytesIO
+from context import RuntimeContext, load_runtime_context
 
 logger = logging.getLogger('ETL-Process.Extract')
 
-def load_config():
-    """
-    Carga el archivo de configuración desde la raíz del proyecto
-    """
-    # Get the absolute path to the root of the project (2 levels up from the current script)
-    script_dir = os.path.dirname(os.path.abspath(__file__))
-    project_root = os.path.dirname(os.path.dirname(script_dir))
-    config_path = os.path.join(project_root, 'config.json')
-    
-    with open(config_path, 'r') as f:
-        return json.load(f)
-
-def check_required_directories():
+def check_required_directories(context: RuntimeContext):
     """
     Verifica si los directorios requeridos existen, si no, los crea
     """
-    config = load_config()
-    # Obtenemos la ruta raíz del proyecto
-    script_dir = os.path.dirname(os.path.abspath(__file__))
-    project_root = os.path.dirname(os.path.dirname(script_dir))
-    
-    # Rutas absolutas para los directorios
-    required_dirs = [
-        os.path.join(project_root, config['paths']['downloads_dir']),
-        os.path.join(project_root, config['paths']['logs_dir']),
-        os.path.join(project_root, config['paths']['processed_dir'])
-    ]
-    
-    for directory in required_dirs:
+    for directory in context.dirs.values():
         if not os.path.exists(directory):
             os.makedirs(directory)
             print(f"Directorio creado: {directory}")
         else:
             print(f"Directorio ya existe: {directory}")
     
-    return {
-        'downloads_dir': os.path.join(project_root, config['paths']['downloads_dir']),
-        'logs_dir': os.path.join(project_root, config['paths']['logs_dir']),
-        'processed_dir': os.path.join(project_root, config['paths']['processed_dir'])
-    }
+    return dict(context.dirs)
 
-def create_folder():
+def create_folder(context: RuntimeContext):
     """
     Crea una carpeta para almacenar los archivos descargados con un timestamp
     """
-    # Cargar configuración
-    config = load_config()
-    
-    # Obtener ruta absoluta al directorio de descargas
-    script_dir = os.path.dirname(os.path.abspath(__file__))
-    project_root = os.path.dirname(os.path.dirname(script_dir))
-    downloads_dir = os.path.join(project_root, config['paths']['downloads_dir'])
+    downloads_dir = context.dirs['downloads_dir']
     
     # Crear carpeta con formato data_probacionismo_yyyymmdd_hhmmss
     current_time = datetime.datetime.now()
@@ -97,14 +63,11 @@ def format_sede_name(sede):
     # Luego dividir por cualquier número de espacios y unir con un solo guión bajo
     return '_'.join(word for word in sede.split() if word)
 
-def save_downloaded_file(excel_content, folder_path, sede, timestamp):
+def save_downloaded_file(excel_content, folder_path, sede, nivel, timestamp):
     """
     Guarda el archivo descargado sin procesamiento
     """
     try:
-        config = load_config()
-        nivel = config['excel_urls'][sede]['nivel']
-        
         formatted_sede = format_sede_name(sede)
         file_name = f"{formatted_sede}-{nivel}-{timestamp.strftime('%Y%m%d_%H%M%S')}.xlsx"
         file_path = os.path.join(folder_path, file_name)
@@ -120,7 +83,10 @@ def save_downloaded_file(excel_content, folder_path, sede, timestamp):
         logger.error(f"Error guardando archivo para {sede}: {str(e)}", exc_info=True)
         return False
 
-def download_and_process_file(url, folder_path, sede, timestamp):
+def download_and_process_file(url, folder_path, sede, nivel, timestamp):
+    # requests se importa al primer uso para no penalizar el arranque
+    import requests
+
     try:
         logger.info(f"Iniciando descarga para sede: {sede}")
         download_url = get_direct_download_url(url)
@@ -199,7 +165,7 @@ def download_and_process_file(url, folder_path, sede, timestamp):
         
         logger.info(f"Archivo descargado correctamente para {sede}")
         # Cambiamos process_excel_file por save_downloaded_file
-        return save_downloaded_file(response.content, folder_path, sede, timestamp)
+        return save_downloaded_file(response.content, folder_path, sede, nivel, timestamp)
     
     except Exception as e:
         logger.error(f"Error descargando archivo para {sede}: {str(e)}", exc_info=True)
@@ -208,16 +174,15 @@ def download_and_process_file(url, folder_path, sede, timestamp):
             logger.error(f"URL de respuesta: {response.url}")
         return False
 
-def download_excel_files():
+def download_excel_files(context: RuntimeContext):
     """
     Ejecuta el proceso de descarga de todos los archivos Excel configurados.
     """
     try:
         logger.info("Iniciando proceso de descarga de archivos Excel")
-        config = load_config()
-        excel_urls = config['excel_urls']
+        excel_urls = context.excel_urls
         
-        folder_path, timestamp = create_folder()
+        folder_path, timestamp = create_folder(context)
         logger.info(f"Carpeta creada para descargas: {folder_path}")
         
         successful_downloads = 0
@@ -227,7 +192,7 @@ def download_excel_files():
         for sede, info in excel_urls.items():
             logger.info(f"Procesando sede: {sede} (Nivel {info['nivel']})")
             download_url = info['url']
-            file_path = download_and_process_file(download_url, folder_path, sede, timestamp)
+            file_path = download_and_process_file(download_url, folder_path, sede, info['nivel'], timestamp)
             
             if file_path:
                 successful_downloads += 1
@@ -245,15 +210,20 @@ def download_excel_files():
         logger.error(f"Error en el proceso de descarga: {str(e)}", exc_info=True)
         return None
 
-def main():
+def main(context: Optional[RuntimeContext] = None):
     try:
         logger.info("=== INICIANDO PROCESO DE EXTRACCIÓN ===")
         start_time = datetime.datetime.now()
         
-        dirs = check_required_directories()
+        if context is None:
+            context = load_runtime_context()
+            logger.info(f"Configuración cargada y validada en {context.load_seconds:.3f} segundos")
+            logger.info(f"Tiempo de arranque: {time.perf_counter() - _IMPORT_START:.3f} segundos")
+        
+        dirs = check_required_directories(context)
         logger.info("Directorios verificados y creados si es necesario")
         
-        download_result = download_excel_files()
+        download_result = download_excel_files(context)
         
         if download_result:
             end_time = datetime.datetime.now()